@@ -7,32 +7,122 @@ Reads emails from Office 365/Outlook using OAuth2.
 import os
 import sys
 import argparse
+import glob
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import shelve
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import msal
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON output when installed
+    orjson = None
+
+
+# Parse .env once at import; EmailReader.reload_env() re-reads it
+load_dotenv()
+_CLIENT_ID = os.getenv("CLIENT_ID")
+_CLIENT_SECRET = os.getenv("CLIENT_SECRET")
+_TENANT_ID = os.getenv("TENANT_ID")
+_EMAIL_ADDRESS = os.getenv("EMAIL_ADDRESS")
+
 
 class EmailReader:
     """Email reader using Microsoft Graph API."""
 
     GRAPH_API_ENDPOINT = "https://graph.microsoft.com/v1.0"
     SCOPES = ["https://graph.microsoft.com/.default"]
+    BODY_SELECT = "subject,from,toRecipients,receivedDateTime,body,hasAttachments"
+    SEARCH_SELECT = "id,subject,from,toRecipients,receivedDateTime,bodyPreview,isRead,hasAttachments"
+    ENRICH_SELECT = f"{SEARCH_SELECT},body"  # Full-body searches fetch only ids up front
+    _BANNER = "=" * 80
+    BATCH_MAX_REQUESTS = 20  # Graph $batch limit per call
+    FETCH_WORKERS = 8  # Concurrent body fetches when $batch is unavailable
+    MAX_RETRY_AFTER = 30  # Upper bound (seconds) on waiting for a throttled sub-request
+    REQUEST_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+    TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/cc_mp_msal.bin")
+    MESSAGE_CACHE_PATH = os.path.expanduser("~/.cache/cc_mp_messages.db")
+    MESSAGE_CACHE_MAX_ENTRIES = 500
 
     def __init__(self):
         """Initialize the email reader with credentials from .env file."""
-        load_dotenv()
-
-        self.client_id = os.getenv("CLIENT_ID")
-        self.client_secret = os.getenv("CLIENT_SECRET")
-        self.tenant_id = os.getenv("TENANT_ID")
-        self.email_address = os.getenv("EMAIL_ADDRESS")
+        self.client_id = _CLIENT_ID
+        self.client_secret = _CLIENT_SECRET
+        self.tenant_id = _TENANT_ID
+        self.email_address = _EMAIL_ADDRESS
 
         self._validate_credentials()
         self.access_token = None
 
+        # Precompute Graph paths; relative ones are also used for $batch sub-requests
+        self._base_user = f"/users/{self.email_address}" if self.email_address else "/me"
+        self._messages_url = f"{self.GRAPH_API_ENDPOINT}{self._base_user}/messages"
+        self._batch_url = f"{self.GRAPH_API_ENDPOINT}/$batch"
+
+        # Persist MSAL tokens between runs so a still-valid token skips the login round-trip
+        self._cache = msal.SerializableTokenCache()
+        if os.path.exists(self.TOKEN_CACHE_PATH):
+            try:
+                with open(self.TOKEN_CACHE_PATH) as cache_file:
+                    self._cache.deserialize(cache_file.read())
+            except (OSError, ValueError):
+                pass  # Unreadable cache; a fresh token will be acquired
+
+        # On-disk cache of enriched messages keyed by id + etag; opened on first use
+        self._message_cache = None
+        self._message_cache_unavailable = False
+
+        # Reuse one pooled session so repeated Graph calls share TCP/TLS connections
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        })
+        # Back off and retry on throttling/transient errors; $batch POSTs are read-only, so retry those too
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True
+        )
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.FETCH_WORKERS,
+            max_retries=retry
+        ))
+
+    @classmethod
+    def reload_env(cls):
+        """Re-read credentials from the environment and .env file for new instances."""
+        global _CLIENT_ID, _CLIENT_SECRET, _TENANT_ID, _EMAIL_ADDRESS
+
+        load_dotenv()
+        _CLIENT_ID = os.getenv("CLIENT_ID")
+        _CLIENT_SECRET = os.getenv("CLIENT_SECRET")
+        _TENANT_ID = os.getenv("TENANT_ID")
+        _EMAIL_ADDRESS = os.getenv("EMAIL_ADDRESS")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session and message cache."""
+        self._session.close()
+        if self._message_cache is not None:
+            self._message_cache.close()
+            self._message_cache = None
+
     def _validate_credentials(self):
         """Validate that all required credentials are present."""
         if not all([self.client_id, self.client_secret, self.tenant_id]):
@@ -41,6 +131,20 @@ class EmailReader:
                 "Required: CLIENT_ID, CLIENT_SECRET, TENANT_ID"
             )
 
+    def _save_token_cache(self):
+        """Write the MSAL token cache to disk if it changed (owner read/write only)."""
+        if not self._cache.has_state_changed:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.TOKEN_CACHE_PATH), exist_ok=True)
+            fd = os.open(self.TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.fchmod(fd, 0o600)  # The open() mode only applies when the file is newly created
+            with os.fdopen(fd, "w") as cache_file:
+                cache_file.write(self._cache.serialize())
+        except OSError:
+            pass  # Caching is best-effort
+
     def authenticate(self) -> bool:
         """
         Authenticate using MSAL with client credentials flow.
@@ -53,14 +157,17 @@ class EmailReader:
             app = msal.ConfidentialClientApplication(
                 self.client_id,
                 authority=authority,
-                client_credential=self.client_secret
+                client_credential=self.client_secret,
+                token_cache=self._cache
             )
 
-            # Acquire token for application
+            # Acquire token for application (served from cache while still valid)
             result = app.acquire_token_for_client(scopes=self.SCOPES)
+            self._save_token_cache()
 
             if "access_token" in result:
                 self.access_token = result["access_token"]
+                self._session.headers["Authorization"] = f"Bearer {self.access_token}"
                 print("✓ Authentication successful")
                 return True
             else:
@@ -74,13 +181,15 @@ class EmailReader:
             print(f"✗ Authentication error: {str(e)}")
             return False
 
-    def _make_graph_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def _make_graph_request(self, url: str, params: Optional[Dict] = None,
+                            json_body: Optional[Dict] = None) -> Optional[Dict]:
         """
         Make a request to Microsoft Graph API.
 
         Args:
-            endpoint: The API endpoint (e.g., '/me/messages')
+            url: The full API URL (e.g., f"{GRAPH_API_ENDPOINT}/me/messages")
             params: Optional query parameters
+            json_body: Optional JSON payload; when given the request is sent as POST
 
         Returns:
             JSON response or None if request fails
@@ -89,15 +198,11 @@ class EmailReader:
             print("✗ Not authenticated. Call authenticate() first.")
             return None
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"{self.GRAPH_API_ENDPOINT}{endpoint}"
-
         try:
-            response = requests.get(url, headers=headers, params=params)
+            if json_body is not None:
+                response = self._session.post(url, params=params, json=json_body, timeout=self.REQUEST_TIMEOUT)
+            else:
+                response = self._session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -120,10 +225,7 @@ class EmailReader:
         Returns:
             List of email dictionaries
         """
-        if self.email_address:
-            endpoint = f"/users/{self.email_address}/mailFolders/{folder}/messages"
-        else:
-            endpoint = f"/me/mailFolders/{folder}/messages"
+        url = f"{self.GRAPH_API_ENDPOINT}{self._base_user}/mailFolders/{folder}/messages"
 
         params = {
             "$top": max_count,
@@ -131,32 +233,120 @@ class EmailReader:
             "$orderby": "receivedDateTime DESC"
         }
 
-        result = self._make_graph_request(endpoint, params)
+        result = self._make_graph_request(url, params)
 
         if result and "value" in result:
             return result["value"]
         return []
 
-    def get_email_body(self, message_id: str) -> Optional[Dict]:
+    def get_email_body(self, message_id: str, fields: Optional[str] = None) -> Optional[Dict]:
         """
         Get full email body for a specific message.
 
         Args:
             message_id: The ID of the message
+            fields: Optional comma-separated $select list (default: BODY_SELECT)
 
         Returns:
             Email details with full body
         """
-        if self.email_address:
-            endpoint = f"/users/{self.email_address}/messages/{message_id}"
-        else:
-            endpoint = f"/me/messages/{message_id}"
-
         params = {
-            "$select": "subject,from,toRecipients,receivedDateTime,body,hasAttachments"
+            "$select": fields or self.BODY_SELECT
         }
 
-        return self._make_graph_request(endpoint, params)
+        return self._make_graph_request(f"{self._messages_url}/{message_id}", params)
+
+    def _batch_get(self, sub_requests: List[Dict]) -> Tuple[List[Optional[Dict]], float]:
+        """
+        Execute GET sub-requests through the Graph JSON $batch endpoint.
+
+        Args:
+            sub_requests: Sub-request dictionaries with a relative 'url' (e.g., '/me/messages/{id}')
+
+        Returns:
+            Tuple of response bodies in input order, with None for sub-requests that failed
+            (including every sub-request of a batch call that itself failed), and the
+            longest Retry-After (seconds) requested by a throttled sub-request
+        """
+        results: List[Optional[Dict]] = [None] * len(sub_requests)
+        retry_after = 0.0
+
+        for start in range(0, len(sub_requests), self.BATCH_MAX_REQUESTS):
+            chunk = sub_requests[start:start + self.BATCH_MAX_REQUESTS]
+            payload = {
+                "requests": [
+                    {"id": str(start + i), "method": "GET", "url": sub_request["url"]}
+                    for i, sub_request in enumerate(chunk)
+                ]
+            }
+
+            result = self._make_graph_request(self._batch_url, json_body=payload)
+            if not result or "responses" not in result:
+                continue  # Leave this chunk's slots as None so the caller re-fetches them
+
+            # Responses may arrive in any order; match them back by id
+            for response in result["responses"]:
+                if 200 <= response.get("status", 0) < 300:
+                    results[int(response["id"])] = response.get("body")
+                else:
+                    # Sub-requests are throttled individually (e.g., 429) inside a 200 envelope
+                    headers = response.get("headers") or {}
+                    try:
+                        retry_after = max(retry_after, float(headers.get("Retry-After", 0)))
+                    except (TypeError, ValueError):
+                        pass
+
+        return results, retry_after
+
+    def _open_message_cache(self) -> Optional[shelve.Shelf]:
+        """Open the message cache on first use, readable by the owner only."""
+        if self._message_cache is not None or self._message_cache_unavailable:
+            return self._message_cache
+
+        old_umask = os.umask(0o077)
+        try:
+            os.makedirs(os.path.dirname(self.MESSAGE_CACHE_PATH), exist_ok=True)
+            self._message_cache = shelve.open(self.MESSAGE_CACHE_PATH)
+            # dbm backends add their own suffixes; tighten files created before this umask was applied
+            for path in glob.glob(glob.escape(self.MESSAGE_CACHE_PATH) + "*"):
+                os.chmod(path, 0o600)
+        except Exception:
+            self._message_cache_unavailable = True  # Caching is best-effort
+        finally:
+            os.umask(old_umask)
+
+        return self._message_cache
+
+    @staticmethod
+    def _message_cache_key(email: Dict) -> Optional[str]:
+        """Build the message cache key for an email, or None if it has no etag."""
+        etag = email.get("@odata.etag")
+        if not etag:
+            return None
+        return f"{email['id']}|{etag}"
+
+    def _get_cached_email(self, email: Dict) -> Optional[Dict]:
+        """Return the cached enriched message for an email, if present and unchanged."""
+        key = self._message_cache_key(email)
+        if key is None or self._open_message_cache() is None:
+            return None
+        try:
+            return self._message_cache.get(key)
+        except Exception:
+            return None
+
+    def _set_cached_email(self, email: Dict, full_email: Dict):
+        """Store an email's enriched message in the cache."""
+        key = self._message_cache_key(email)
+        if key is None or self._open_message_cache() is None:
+            return
+        try:
+            # Keep the cache small: start over once it reaches the limit
+            if len(self._message_cache) >= self.MESSAGE_CACHE_MAX_ENTRIES:
+                self._message_cache.clear()
+            self._message_cache[key] = full_email
+        except Exception:
+            pass  # Caching is best-effort
 
     def search_emails(self, query: str, max_count: int = 10, search_in: str = "all", include_body: bool = False) -> List[Dict]:
         """
@@ -171,52 +361,76 @@ class EmailReader:
         Returns:
             List of matching email dictionaries
         """
-        if self.email_address:
-            endpoint = f"/users/{self.email_address}/messages"
-        else:
-            endpoint = "/me/messages"
-
         # Construct query based on search_in parameter
         params = {
             "$top": max_count,
-            "$select": "id,subject,from,toRecipients,receivedDateTime,bodyPreview,isRead,hasAttachments"
+            # With include_body the enrichment step supplies every field, so only ids are needed here
+            "$select": "id" if include_body else self.SEARCH_SELECT
         }
 
-        if search_in == "subject":
-            # Use $filter for subject-only search
-            params["$filter"] = f"contains(subject, '{query}')"
-        elif search_in == "body":
-            # For body search, we'll use $search with full-text and filter results manually
-            # Note: Direct body filtering is limited in Graph API
-            params["$search"] = f'"{query}"'
+        # Escape embedded double quotes so the KQL phrase stays intact;
+        # requests handles URL encoding of the params
+        kql_query = query.replace('"', '\\"')
+
+        if search_in in ("subject", "body"):
+            # KQL property restrictions bind to a single term, so restrict every term
+            # ("subject:team subject:meeting"); this uses the server-side index and
+            # keeps non-matching messages out of the results
+            terms = [term.replace('"', "") for term in query.split()]
+            params["$search"] = '"' + " ".join(f"{search_in}:{term}" for term in terms if term) + '"'
         else:  # "all"
             # Use $search for full-text search across all fields
-            params["$search"] = f'"{query}"'
+            params["$search"] = f'"{kql_query}"'
 
-        result = self._make_graph_request(endpoint, params)
+        result = self._make_graph_request(self._messages_url, params)
 
         if result and "value" in result:
             emails = result["value"]
 
-            # If searching body only, filter results to only include emails with query in body
-            if search_in == "body":
-                filtered_emails = []
-                for email in emails:
-                    body_preview = email.get("bodyPreview", "").lower()
-                    if query.lower() in body_preview:
-                        filtered_emails.append(email)
-                emails = filtered_emails
-
-            # If include_body is True, fetch full body for each email
-            if include_body:
-                enriched_emails = []
+            # If include_body is True, fetch full bodies in as few $batch calls as possible
+            if include_body and emails:
+                # Serve unchanged messages from the message cache
+                pending = []
                 for email in emails:
-                    full_email = self.get_email_body(email["id"])
-                    if full_email:
-                        enriched_emails.append(full_email)
+                    cached_email = self._get_cached_email(email)
+                    if cached_email is not None:
+                        email.update(cached_email)
                     else:
-                        enriched_emails.append(email)
-                return enriched_emails
+                        pending.append(email)
+
+                if pending:
+                    full_emails, retry_after = self._batch_get([
+                        {"url": f"{self._base_user}/messages/{email['id']}?$select={self.ENRICH_SELECT}"}
+                        for email in pending
+                    ])
+                    failed = [i for i, full_email in enumerate(full_emails) if full_email is None]
+                    if failed:
+                        # $batch rejected or partially failed; fetch the missing ones concurrently
+                        if retry_after:
+                            time.sleep(min(retry_after, self.MAX_RETRY_AFTER))
+                        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+                            refetched = executor.map(
+                                lambda i: self.get_email_body(pending[i]["id"], fields=self.ENRICH_SELECT),
+                                failed
+                            )
+                            for i, full_email in zip(failed, refetched):
+                                full_emails[i] = full_email
+
+                    missing_ids = set()
+                    for email, full_email in zip(pending, full_emails):
+                        if full_email:
+                            self._set_cached_email(email, full_email)
+                            email.update(full_email)
+                        else:
+                            missing_ids.add(email["id"])
+
+                    # The first pass only carried ids, so unfetched messages have nothing to show
+                    if missing_ids:
+                        print(
+                            f"✗ Could not fetch {len(missing_ids)} message(s); omitted from results",
+                            file=sys.stderr
+                        )
+                        emails = [email for email in emails if email["id"] not in missing_ids]
 
             return emails
         return []
@@ -236,10 +450,9 @@ class EmailReader:
         from_name = from_addr.get("name", "Unknown")
         from_email = from_addr.get("address", "Unknown")
 
+        # Graph returns ISO-8601 UTC ("2024-01-31T09:15:00Z"); slicing avoids a datetime round-trip
         received = email.get("receivedDateTime", "")
-        if received:
-            dt = datetime.fromisoformat(received.replace("Z", "+00:00"))
-            received = dt.strftime("%Y-%m-%d %H:%M:%S")
+        received = received[:19].replace("T", " ") if received else ""
 
         subject = email.get("subject", "(No subject)")
         preview = email.get("bodyPreview", "")
@@ -247,59 +460,69 @@ class EmailReader:
         has_attachments = "📎" if email.get("hasAttachments") else ""
 
         output = f"""
-{'=' * 80}
+{EmailReader._BANNER}
 From: {from_name} <{from_email}>
 Date: {received}
 Subject: {subject}
 Read: {is_read} {has_attachments}
 ---
 {preview[:200]}{'...' if len(preview) > 200 else ''}
-{'=' * 80}
+{EmailReader._BANNER}
 """
         return output
 
     @staticmethod
-    def format_emails_json(emails: List[Dict]) -> str:
+    def format_emails_json(emails: List[Dict], compact: bool = False) -> str:
         """
         Format emails as JSON array.
 
         Args:
             emails: List of email dictionaries from Graph API
+            compact: If True, emit minified JSON instead of indented output (default: False)
 
         Returns:
             JSON string representation
         """
         formatted_emails = []
+        append = formatted_emails.append
         for email in emails:
+            get = email.get
+            sender = (get("from") or {}).get("emailAddress") or {}
             formatted_email = {
-                "id": email.get("id"),
-                "subject": email.get("subject"),
+                "id": get("id"),
+                "subject": get("subject"),
                 "from": {
-                    "name": email.get("from", {}).get("emailAddress", {}).get("name"),
-                    "address": email.get("from", {}).get("emailAddress", {}).get("address")
+                    "name": sender.get("name"),
+                    "address": sender.get("address")
                 },
                 "to": [
-                    {
-                        "name": recipient.get("emailAddress", {}).get("name"),
-                        "address": recipient.get("emailAddress", {}).get("address")
-                    }
-                    for recipient in email.get("toRecipients", [])
+                    {"name": address.get("name"), "address": address.get("address")}
+                    for address in (
+                        recipient.get("emailAddress") or {}
+                        for recipient in get("toRecipients") or ()
+                    )
                 ],
-                "receivedDateTime": email.get("receivedDateTime"),
-                "isRead": email.get("isRead"),
-                "hasAttachments": email.get("hasAttachments"),
-                "bodyPreview": email.get("bodyPreview")
+                "receivedDateTime": get("receivedDateTime"),
+                "isRead": get("isRead"),
+                "hasAttachments": get("hasAttachments"),
+                "bodyPreview": get("bodyPreview")
             }
 
             # Include full body if available
             if "body" in email:
+                body = get("body") or {}
                 formatted_email["body"] = {
-                    "contentType": email.get("body", {}).get("contentType"),
-                    "content": email.get("body", {}).get("content")
+                    "contentType": body.get("contentType"),
+                    "content": body.get("content")
                 }
 
-            formatted_emails.append(formatted_email)
+            append(formatted_email)
 
+        if orjson is not None:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            return orjson.dumps(formatted_emails, option=option).decode()
+        if compact:
+            return json.dumps(formatted_emails, separators=(",", ":"), ensure_ascii=False)
         return json.dumps(formatted_emails, indent=2, ensure_ascii=False)
 
 
@@ -365,6 +588,12 @@ Examples:
         help="Fetch full email body content (slower, makes additional API calls)"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit minified JSON without indentation (only with --format json)"
+    )
+
     args = parser.parse_args()
 
     # Validate count
@@ -375,60 +604,58 @@ Examples:
         print("Email Reader - Microsoft Graph API with MSAL\n")
 
     # Initialize reader
-    reader = EmailReader()
-
-    # Authenticate
-    if not reader.authenticate():
-        if args.format != "json":
-            print("\nAuthentication failed. Please check your credentials.")
-        sys.exit(1)
-
-    # Perform action based on arguments
-    if args.search:
-        # Search emails
-        search_location = args.search_in
-        if args.format != "json":
-            print(f"\nSearching for '{args.search}' in {search_location}...\n")
-
-        emails = reader.search_emails(
-            args.search,
-            max_count=args.count,
-            search_in=search_location,
-            include_body=args.full_body
-        )
-
-        if not emails:
-            if args.format == "json":
-                print("[]")
-            else:
-                print("No matching emails found.")
-            return
-
-        if args.format != "json":
-            print(f"Found {len(emails)} matching email(s):\n")
-
-    else:
-        # List recent emails (default behavior)
-        if args.format != "json":
-            print(f"\nFetching {args.count} recent emails from inbox...\n")
-        emails = reader.get_emails(max_count=args.count)
+    with EmailReader() as reader:
+        # Authenticate
+        if not reader.authenticate():
+            if args.format != "json":
+                print("\nAuthentication failed. Please check your credentials.")
+            sys.exit(1)
+
+        # Perform action based on arguments
+        if args.search:
+            # Search emails
+            search_location = args.search_in
+            if args.format != "json":
+                print(f"\nSearching for '{args.search}' in {search_location}...\n")
+
+            emails = reader.search_emails(
+                args.search,
+                max_count=args.count,
+                search_in=search_location,
+                include_body=args.full_body
+            )
 
-        if not emails:
-            if args.format == "json":
-                print("[]")
-            else:
-                print("No emails found or error occurred.")
-            return
+            if not emails:
+                if args.format == "json":
+                    print("[]")
+                else:
+                    print("No matching emails found.")
+                return
 
-        if args.format != "json":
-            print(f"Found {len(emails)} email(s):\n")
+            if args.format != "json":
+                print(f"Found {len(emails)} matching email(s):\n")
 
-    # Display results based on format
-    if args.format == "json":
-        print(EmailReader.format_emails_json(emails))
-    else:
-        for email in emails:
-            print(EmailReader.format_email(email))
+        else:
+            # List recent emails (default behavior)
+            if args.format != "json":
+                print(f"\nFetching {args.count} recent emails from inbox...\n")
+            emails = reader.get_emails(max_count=args.count)
+
+            if not emails:
+                if args.format == "json":
+                    print("[]")
+                else:
+                    print("No emails found or error occurred.")
+                return
+
+            if args.format != "json":
+                print(f"Found {len(emails)} email(s):\n")
+
+        # Display results based on format
+        if args.format == "json":
+            sys.stdout.write(EmailReader.format_emails_json(emails, compact=args.compact) + "\n")
+        else:
+            sys.stdout.write("\n".join(EmailReader.format_email(email) for email in emails) + "\n")
 
 
 if __name__ == "__main__":